@@ -53,10 +53,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: MinolConfigEntry) -> boo
     async def _async_options_updated(
         hass: HomeAssistant, entry: MinolConfigEntry
     ) -> None:
-        """Handle options update — adjust polling interval; reload only if needed."""
+        """Handle options update — reload only when the options really changed.
+
+        Token-refresh data updates also fire this listener; they must not touch
+        the coordinator, whose polling interval may be backed off.  A reload
+        re-reads the scan interval and does a fresh first refresh anyway.
+        """
         nonlocal _known_options
-        coordinator_inner: MinolDataCoordinator = entry.runtime_data
-        coordinator_inner.update_interval = _get_update_interval(entry)
         if entry.options != _known_options:
             # Real options change (scan interval or prices) — reload to recreate sensors.
             _known_options = dict(entry.options)
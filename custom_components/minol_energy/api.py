@@ -10,7 +10,8 @@ Authentication flow (Azure B2C OAuth2 → Bearer token):
      can trigger HA's re-authentication flow.
 
 Data flow:
-  1. GET ``/profiles`` → user profile containing billingUnit + residentialUnitID.
+  1. GET ``/profiles`` → user profile containing billingUnit + residentialUnitID
+     (cached on the client for a day).
   2. GET ``/billingUnit/{bu}/residentialUnit/{ru}/masterdata`` → billing periods.
   3. GET ``/billingUnit/{bu}/residentialUnit/{ru}/consumptions/availableData``
      → list of available consumption periods.
@@ -27,14 +28,18 @@ Enable debug logging in configuration.yaml to see full request/response details:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import logging
+import sys
+import time
 import uuid
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     API_BASE_URL,
@@ -51,6 +56,47 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh the access token this long before it actually expires
+_TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# How long the /profiles result is reused before it is fetched again (seconds).
+# The profile only changes when the tenant moves, so daily is plenty.
+_PROFILE_CACHE_TTL = 24 * 3600
+
+# Pause before retrying a request after a transient network error (seconds)
+_RETRY_DELAY = 0.5
+
+# Request parts that never change – merged with the per-call values only
+_API_HEADERS_BASE = {
+    "client_id": API_CLIENT_ID,
+    "client_secret": API_CLIENT_SECRET,
+    "appVersion": APP_VERSION,
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+_REFRESH_PAYLOAD_BASE = {
+    "grant_type": "refresh_token",
+    "client_id": B2C_CLIENT_ID,
+    "client_secret": B2C_CLIENT_SECRET,
+    "redirect_uri": B2C_REDIRECT_URI,
+    "scope": B2C_SCOPES,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _unit_path(billing_unit_id: str, residential_unit_id: str, endpoint: str) -> str:
+    """Return ``/billingUnit/{bu}/residentialUnit/{ru}/{endpoint}``.
+
+    The IDs are fixed for a given profile, so each path is formatted once
+    and reused on every poll.
+    """
+    return (
+        f"/billingUnit/{billing_unit_id}"
+        f"/residentialUnit/{residential_unit_id}"
+        f"/{endpoint}"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -98,6 +144,18 @@ class MinolApiClient:
         self._session: aiohttp.ClientSession | None = None
         # Proactive refresh: track when the access token expires
         self._token_expiry: datetime | None = None
+        # Conditional GET cache, one entry per URL:
+        # url → (query params, ETag, Last-Modified, parsed body).
+        # Keying by URL alone keeps the cache bounded even though
+        # startdate/enddate change daily; a new query replaces the entry.
+        self._cache: dict[
+            str, tuple[tuple[tuple[str, str], ...], str | None, str | None, Any]
+        ] = {}
+        # Serialises token refreshes so concurrent 401s trigger only one
+        self._refresh_lock = asyncio.Lock()
+        # Primary profile from /profiles and when it was fetched (monotonic)
+        self._profile_cache: dict[str, Any] | None = None
+        self._profile_cache_ts = 0.0
 
     def set_token_expiry(self, expires_in: int) -> None:
         """Record when the current access token expires (seconds from now)."""
@@ -112,16 +170,31 @@ class MinolApiClient:
         """Return True if the access token has expired or will within 60 s."""
         if self._token_expiry is None:
             return False
-        return datetime.now(timezone.utc) >= self._token_expiry - timedelta(seconds=60)
+        return datetime.now(timezone.utc) >= self._token_expiry - _TOKEN_EXPIRY_MARGIN
 
     # ------------------------------------------------------------------
     # Session management
     # ------------------------------------------------------------------
 
     def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        The connector keeps TLS connections to the API and B2C hosts alive
+        between coordinator polls so each refresh does not pay a new handshake.
+        Both hosts authenticate via headers/form fields only, so cookies are
+        discarded instead of being stored and matched on every request.
+        """
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=8,
+                    limit_per_host=4,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
                 headers={"User-Agent": USER_AGENT},
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
             )
         return self._session
 
@@ -134,8 +207,24 @@ class MinolApiClient:
     # Token refresh (silent)
     # ------------------------------------------------------------------
 
-    async def _refresh_access_token(self) -> bool:
-        """Silently refresh the access token using the stored refresh token."""
+    async def _refresh_access_token(self, stale_token: str | None = None) -> bool:
+        """Silently refresh the access token using the stored refresh token.
+
+        ``stale_token`` is the token the caller found to be rejected or
+        expired (default: the current one).  If the stored token no longer
+        matches it, another coroutine has refreshed in the meantime – even if
+        that finished before this call – and the new token is reused instead
+        of posting to B2C again.
+        """
+        if stale_token is None:
+            stale_token = self._access_token
+        async with self._refresh_lock:
+            if self._access_token != stale_token:
+                _LOGGER.debug("Access token already refreshed by a concurrent request")
+                return True
+            return await self._do_refresh_access_token()
+
+    async def _do_refresh_access_token(self) -> bool:
         if not self._refresh_token:
             _LOGGER.warning(
                 "Token refresh requested but no refresh_token is stored."
@@ -145,14 +234,7 @@ class MinolApiClient:
 
         _LOGGER.debug("Attempting silent token refresh via B2C: %s", B2C_TOKEN_URL)
         session = self._ensure_session()
-        payload = {
-            "grant_type": "refresh_token",
-            "refresh_token": self._refresh_token,
-            "client_id": B2C_CLIENT_ID,
-            "client_secret": B2C_CLIENT_SECRET,
-            "redirect_uri": B2C_REDIRECT_URI,
-            "scope": B2C_SCOPES,
-        }
+        payload = {**_REFRESH_PAYLOAD_BASE, "refresh_token": self._refresh_token}
 
         try:
             async with session.post(
@@ -163,7 +245,7 @@ class MinolApiClient:
                 body = await resp.text()
                 if resp.status != 200:
                     try:
-                        err = json.loads(body)
+                        err = orjson.loads(body)
                         desc = err.get("error_description") or err.get("error") or body
                     except Exception:
                         desc = body
@@ -172,7 +254,7 @@ class MinolApiClient:
                     )
                     return False
 
-                token_data = json.loads(body)
+                token_data = orjson.loads(body)
                 new_token = token_data.get("access_token")
                 if not new_token:
                     _LOGGER.warning(
@@ -209,13 +291,9 @@ class MinolApiClient:
     def _api_headers(self) -> dict[str, str]:
         """Build the headers required by every Mulesoft API request."""
         return {
+            **_API_HEADERS_BASE,
             "Authorization": f"Bearer {self._access_token}",
-            "client_id": API_CLIENT_ID,
-            "client_secret": API_CLIENT_SECRET,
             "correlationId": str(uuid.uuid4()),
-            "appVersion": APP_VERSION,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
         }
 
     def _url(self, path: str) -> str:
@@ -230,25 +308,43 @@ class MinolApiClient:
     ) -> Any:
         session = self._ensure_session()
         url = self._url(path)
+        cacheable = method == "GET" and payload is None
+        params_key = tuple(sorted(params.items())) if params else ()
 
         # Proactive refresh before the request if we know the token has expired
         if self._is_token_expired():
             _LOGGER.debug("Access token near expiry, proactively refreshing")
-            if not await self._refresh_access_token():
+            if not await self._refresh_access_token(self._access_token):
                 raise MinolAuthError(
                     "Proactive token refresh failed – re-authentication required"
                 )
 
         for attempt in range(2):
             try:
+                # Remember which token this attempt sends, so a 401 refreshes
+                # only if nobody has replaced it since
+                sent_token = self._access_token
+                headers = self._api_headers()
+                cached = self._cache.get(url) if cacheable else None
+                if cached and cached[0] != params_key:
+                    # Validators belong to a different query (e.g. yesterday's
+                    # enddate) and must not be sent for this one
+                    cached = None
+                if cached:
+                    _, etag, last_modified, _ = cached
+                    if etag:
+                        headers["If-None-Match"] = etag
+                    if last_modified:
+                        headers["If-Modified-Since"] = last_modified
                 kwargs: dict[str, Any] = {
-                    "headers": self._api_headers(),
+                    "headers": headers,
                     "allow_redirects": True,
                 }
                 if params:
                     kwargs["params"] = params
                 if payload is not None:
-                    kwargs["json"] = payload
+                    # Content-Type: application/json is already in the headers
+                    kwargs["data"] = orjson.dumps(payload)
 
                 _LOGGER.debug("→ %s %s params=%s", method, url, params)
                 async with session.request(method, url, **kwargs) as resp:
@@ -259,13 +355,17 @@ class MinolApiClient:
                             "Received HTTP %s from Minol API – attempting token refresh",
                             resp.status,
                         )
-                        if not await self._refresh_access_token():
+                        if not await self._refresh_access_token(sent_token):
                             raise MinolAuthError(
                                 "Token expired and silent refresh failed"
                                 " – re-authentication required"
                             )
                         continue
 
+                    if resp.status == 304 and cached:
+                        _LOGGER.debug("Not modified, reusing cached %s %s", method, url)
+                        return cached[3]
+
                     if resp.status != 200:
                         body = await resp.text()
                         _LOGGER.error(
@@ -277,12 +377,28 @@ class MinolApiClient:
                         )
                         return None
 
-                    text = await resp.text()
-                    if not text.strip():
+                    # Skip the read entirely when the server declares an empty
+                    # body; chunked responses still fall through to the check below.
+                    if resp.content_length == 0:
                         _LOGGER.debug("Empty response body for %s %s", method, url)
                         return None
 
-                    result = json.loads(text)
+                    raw = await resp.read()
+                    if not raw.strip():
+                        _LOGGER.debug("Empty response body for %s %s", method, url)
+                        return None
+
+                    # orjson decodes the raw bytes in one pass (no str copy)
+                    try:
+                        result = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        _LOGGER.error(
+                            "Minol API %s %s returned invalid JSON: %s",
+                            method,
+                            url,
+                            raw[:400],
+                        )
+                        return None
                     _LOGGER.debug(
                         "Parsed response for %s %s: %s keys / %s items",
                         method,
@@ -290,11 +406,24 @@ class MinolApiClient:
                         len(result) if isinstance(result, dict) else "—",
                         len(result) if isinstance(result, list) else "—",
                     )
+                    if cacheable:
+                        etag = resp.headers.get("ETag")
+                        last_modified = resp.headers.get("Last-Modified")
+                        if etag or last_modified:
+                            self._cache[url] = (
+                                params_key, etag, last_modified, result
+                            )
+                        else:
+                            self._cache.pop(url, None)
                     return result
 
-            except aiohttp.ClientError as err:
+            except (aiohttp.ClientError, TimeoutError) as err:
+                # Network errors and timeouts (the session's ClientTimeout
+                # raises a bare TimeoutError) say nothing about the token –
+                # retry as-is; only an explicit 401/403 above triggers a refresh.
                 if attempt == 0:
                     _LOGGER.debug("Network error on attempt 1 (%s), retrying", err)
+                    await asyncio.sleep(_RETRY_DELAY)
                     continue
                 raise MinolConnectionError(
                     f"Cannot reach Minol API at {url}: {err}"
@@ -349,11 +478,7 @@ class MinolApiClient:
                 year=datetime.now(timezone.utc).year - 2
             ).strftime("%Y-%m-%d")
 
-        path = (
-            f"/billingUnit/{billing_unit_id}"
-            f"/residentialUnit/{residential_unit_id}"
-            "/masterdata"
-        )
+        path = _unit_path(billing_unit_id, residential_unit_id, "masterdata")
         return await self._get(path, startdate=startdate)
 
     async def get_available_periods(
@@ -362,10 +487,8 @@ class MinolApiClient:
         residential_unit_id: str,
     ) -> list[dict[str, Any]]:
         """Return the list of available consumption periods."""
-        path = (
-            f"/billingUnit/{billing_unit_id}"
-            f"/residentialUnit/{residential_unit_id}"
-            "/consumptions/availableData"
+        path = _unit_path(
+            billing_unit_id, residential_unit_id, "consumptions/availableData"
         )
         result = await self._get(path)
         if isinstance(result, dict):
@@ -380,11 +503,7 @@ class MinolApiClient:
         enddate: str,
     ) -> list[dict[str, Any]]:
         """Fetch consumption data for a date range (YYYY-MM-DD strings)."""
-        path = (
-            f"/billingUnit/{billing_unit_id}"
-            f"/residentialUnit/{residential_unit_id}"
-            "/consumptions"
-        )
+        path = _unit_path(billing_unit_id, residential_unit_id, "consumptions")
         result = await self._get(path, startdate=startdate, enddate=enddate)
         if isinstance(result, list):
             return result
@@ -394,6 +513,22 @@ class MinolApiClient:
     # Aggregate data method used by the coordinator
     # ------------------------------------------------------------------
 
+    async def _get_primary_profile(self) -> dict[str, Any]:
+        """Return the first profile, reusing the cached one for up to a day."""
+        now = time.monotonic()
+        if (
+            self._profile_cache is None
+            or now - self._profile_cache_ts > _PROFILE_CACHE_TTL
+        ):
+            profiles = await self.get_profiles()
+            if not profiles:
+                raise MinolAuthError(
+                    "No profiles returned – cannot fetch consumption data"
+                )
+            self._profile_cache = profiles[0]
+            self._profile_cache_ts = now
+        return self._profile_cache
+
     async def get_all_data(self) -> dict[str, Any]:
         """Collect all data needed by the integration sensors.
 
@@ -405,13 +540,7 @@ class MinolApiClient:
           - ``latest_consumption``: the most recent consumption period dict
           - ``available_periods``: list of available period dicts
         """
-        profiles = await self.get_profiles()
-        if not profiles:
-            raise MinolAuthError(
-                "No profiles returned – cannot fetch consumption data"
-            )
-
-        profile = profiles[0]
+        profile = await self._get_primary_profile()
         billing_unit_id = profile.get("billingUnit", "")
         residential_unit_id = (
             profile.get("residentialUnitReference", {}).get("residentialUnitID", "")
@@ -426,11 +555,6 @@ class MinolApiClient:
             residential_unit_id,
         )
 
-        masterdata = await self.get_masterdata(billing_unit_id, residential_unit_id) or {}
-        available_periods = await self.get_available_periods(
-            billing_unit_id, residential_unit_id
-        )
-
         now = datetime.now(timezone.utc)
         start_month = now.replace(day=1)
         if start_month.month <= 3:
@@ -441,12 +565,34 @@ class MinolApiClient:
         else:
             startdate = start_month.replace(month=start_month.month - 3)
 
-        consumptions = await self.get_consumptions(
-            billing_unit_id,
-            residential_unit_id,
-            startdate=startdate.strftime("%Y-%m-%d"),
-            enddate=now.strftime("%Y-%m-%d"),
-        )
+        # The three residence endpoints only depend on the profile, so fetch
+        # them concurrently instead of paying three sequential round-trips.
+        # A TaskGroup cancels the siblings as soon as one request fails, so
+        # none keeps running (or refreshing the token) after we have raised.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                masterdata_task = tg.create_task(
+                    self.get_masterdata(billing_unit_id, residential_unit_id)
+                )
+                periods_task = tg.create_task(
+                    self.get_available_periods(billing_unit_id, residential_unit_id)
+                )
+                consumptions_task = tg.create_task(
+                    self.get_consumptions(
+                        billing_unit_id,
+                        residential_unit_id,
+                        startdate=startdate.strftime("%Y-%m-%d"),
+                        enddate=now.strftime("%Y-%m-%d"),
+                    )
+                )
+        except ExceptionGroup as err:
+            # Re-raise the first failure itself so callers can keep catching
+            # MinolAuthError / MinolConnectionError; drop the group as context
+            # so logged tracebacks show only that failure
+            raise err.exceptions[0] from None
+        masterdata = masterdata_task.result() or {}
+        available_periods = periods_task.result()
+        consumptions = consumptions_task.result()
 
         _LOGGER.debug(
             "Fetched %d available periods, %d consumption periods",
@@ -487,6 +633,25 @@ class MinolApiClient:
     # Convenience helpers for sensors
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def index_consumptions(
+        consumption_period: dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
+        """Map service code → consumption entry for a consumption period.
+
+        Build this once per period and look services up by key instead of
+        scanning the ``consumptions`` list for each one.  If a service appears
+        more than once, the first entry wins.  Codes are interned so lookups
+        with the ``SERVICE_*`` constants hit the identity fast path.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for cons in consumption_period.get("consumptions", []):
+            service = cons.get("service")
+            if isinstance(service, str):
+                service = sys.intern(service)
+            index.setdefault(service, cons)
+        return index
+
     @staticmethod
     def get_service_value(
         consumption_period: dict[str, Any],
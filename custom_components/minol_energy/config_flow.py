@@ -21,13 +21,13 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import json
 import logging
 import os
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import aiohttp
+import orjson
 import voluptuous as vol
 
 from homeassistant.config_entries import (
@@ -55,6 +55,11 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Schemas / validators that do not depend on the entry are built once at import
+_REDIRECT_URL_SCHEMA = vol.Schema({vol.Required("redirect_url"): str})
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=15, max=1440))
+_PRICE_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.0))
+
 
 # ---------------------------------------------------------------------------
 # PKCE + OAuth2 helpers
@@ -117,7 +122,7 @@ async def _exchange_code_for_tokens(
             body = await resp.text()
             if resp.status != 200:
                 try:
-                    err = json.loads(body)
+                    err = orjson.loads(body)
                     msg = err.get("error_description") or err.get("error") or body
                 except Exception:
                     msg = body
@@ -125,7 +130,7 @@ async def _exchange_code_for_tokens(
                 raise ValueError(
                     f"Token exchange failed (HTTP {resp.status}): {msg}"
                 )
-            token_data = json.loads(body)
+            token_data = orjson.loads(body)
             _LOGGER.debug(
                 "Token exchange successful: expires_in=%s has_refresh=%s",
                 token_data.get("expires_in"),
@@ -143,7 +148,7 @@ def _get_email_from_token(token_data: dict[str, Any]) -> str | None:
             return None
         padding = 4 - (len(parts[1]) % 4)
         payload_bytes = base64.urlsafe_b64decode(parts[1] + "=" * padding)
-        claims = json.loads(payload_bytes)
+        claims = orjson.loads(payload_bytes)
         return (
             claims.get("email")
             or (claims.get("emails") or [None])[0]
@@ -231,7 +236,7 @@ class MinolEnergyConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({vol.Required("redirect_url"): str}),
+            data_schema=_REDIRECT_URL_SCHEMA,
             description_placeholders={"auth_url": self._auth_url},
             errors=errors,
         )
@@ -267,7 +272,7 @@ class MinolEnergyConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({vol.Required("redirect_url"): str}),
+            data_schema=_REDIRECT_URL_SCHEMA,
             description_placeholders={"auth_url": self._auth_url},
             errors=errors,
         )
@@ -298,19 +303,19 @@ class MinolOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
                         default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL // 60),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=15, max=1440)),
+                    ): _SCAN_INTERVAL_VALIDATOR,
                     vol.Optional(
                         CONF_HEATING_PRICE,
                         default=options.get(CONF_HEATING_PRICE, 0.0),
-                    ): vol.All(vol.Coerce(float), vol.Range(min=0.0)),
+                    ): _PRICE_VALIDATOR,
                     vol.Optional(
                         CONF_HOT_WATER_PRICE,
                         default=options.get(CONF_HOT_WATER_PRICE, 0.0),
-                    ): vol.All(vol.Coerce(float), vol.Range(min=0.0)),
+                    ): _PRICE_VALIDATOR,
                     vol.Optional(
                         CONF_COLD_WATER_PRICE,
                         default=options.get(CONF_COLD_WATER_PRICE, 0.0),
-                    ): vol.All(vol.Coerce(float), vol.Range(min=0.0)),
+                    ): _PRICE_VALIDATOR,
                 }
             ),
         )
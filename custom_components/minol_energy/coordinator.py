@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import hashlib
 import logging
 from typing import Any
 
+import orjson
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -19,6 +22,12 @@ from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for the adaptive polling interval while the API data is unchanged
+MAX_BACKOFF_INTERVAL = timedelta(hours=6)
+
+# Consumption fields that back sensor states; parsed to float once per refresh
+VALUE_FIELDS = ("energyValue", "co2kg")
+
 
 def _get_update_interval(entry: ConfigEntry) -> timedelta:
     """Return the update interval from options (minutes) or the default."""
@@ -26,6 +35,29 @@ def _get_update_interval(entry: ConfigEntry) -> timedelta:
     return timedelta(minutes=minutes)
 
 
+def _backoff_interval(base: timedelta, stable_cycles: int) -> timedelta:
+    """Double the interval per unchanged poll, capped but never below ``base``."""
+    # 2**10 × the 15 min minimum already exceeds the cap; avoids timedelta overflow
+    return max(base, min(base * 2 ** min(stable_cycles, 10), MAX_BACKOFF_INTERVAL))
+
+
+def _parse_values(
+    index: dict[str, dict[str, Any]],
+) -> dict[tuple[str, str], float]:
+    """Return ``{(service, field): float}`` for every numeric value in ``index``."""
+    values: dict[tuple[str, str], float] = {}
+    for service, cons in index.items():
+        for field in VALUE_FIELDS:
+            val = cons.get(field)
+            if val is None:
+                continue
+            try:
+                values[(service, field)] = float(val)
+            except (TypeError, ValueError):
+                _LOGGER.debug("Ignoring non-numeric %s=%r for service %s", field, val, service)
+    return values
+
+
 class MinolDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Shared data fetcher for the Minol mobile app API."""
 
@@ -40,21 +72,39 @@ class MinolDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.client = client
         self.entry = entry
+        # Minol publishes new values at most daily, so back off while the
+        # payload stays identical and return to the configured interval on change.
+        self._last_payload_hash: bytes | None = None
+        self._stable_cycles = 0
+        # Latest period and its consumptions keyed by service code, rebuilt
+        # per refresh so sensors read them without re-walking ``data``
+        self.latest_consumption: dict[str, Any] = {}
+        self.consumption_index: dict[str, dict[str, Any]] = {}
+        self.consumption_values: dict[tuple[str, str], float] = {}
+        # Service codes present in the latest period; sensors are created for these
+        self.active_services: frozenset[str] = frozenset()
 
     async def _async_update_data(self) -> dict[str, Any]:
         _LOGGER.debug("Starting data refresh for entry %s", self.entry.entry_id)
         try:
             data = await self.client.get_all_data()
+            latest = data.get("latest_consumption") or {}
             _LOGGER.debug(
                 "Data refresh complete: billingUnit=%s residentialUnit=%s"
                 " availablePeriods=%d latestPeriod=%s",
                 data.get("billing_unit_id"),
                 data.get("residential_unit_id"),
                 len(data.get("available_periods", [])),
-                data.get("latest_consumption", {}).get("period"),
+                latest.get("period"),
             )
+            self._adapt_update_interval(data)
+            self.latest_consumption = latest
+            self.consumption_index = MinolApiClient.index_consumptions(latest)
+            self.active_services = frozenset(self.consumption_index)
+            self.consumption_values = _parse_values(self.consumption_index)
             return data
         except MinolAuthError as err:
+            self._reset_update_interval()
             _LOGGER.warning(
                 "Authentication error during data refresh – triggering reauth: %s", err
             )
@@ -62,8 +112,34 @@ class MinolDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 f"Authentication failed: {err}"
             ) from err
         except MinolConnectionError as err:
+            self._reset_update_interval()
             _LOGGER.error("Connection error during data refresh: %s", err)
             raise UpdateFailed(f"Connection error: {err}") from err
         except Exception as err:
+            self._reset_update_interval()
             _LOGGER.exception("Unexpected error during data refresh")
             raise UpdateFailed(f"Unexpected error: {err}") from err
+
+    def _adapt_update_interval(self, data: dict[str, Any]) -> None:
+        """Grow the polling interval while the fetched data is unchanged."""
+        payload_hash = hashlib.blake2b(orjson.dumps(data), digest_size=8).digest()
+        if payload_hash == self._last_payload_hash:
+            self._stable_cycles += 1
+        else:
+            self._stable_cycles = 0
+            self._last_payload_hash = payload_hash
+
+        self.update_interval = _backoff_interval(
+            _get_update_interval(self.entry), self._stable_cycles
+        )
+        if self._stable_cycles:
+            _LOGGER.debug(
+                "Data unchanged for %d poll(s), next refresh in %s",
+                self._stable_cycles,
+                self.update_interval,
+            )
+
+    def _reset_update_interval(self) -> None:
+        """Drop any backoff so a failed refresh retries at the configured interval."""
+        self._stable_cycles = 0
+        self.update_interval = _get_update_interval(self.entry)
@@ -10,8 +10,8 @@ from homeassistant.core import HomeAssistant
 from . import MinolConfigEntry
 from .const import CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN
 
-REDACT_CONFIG = {CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN}
-REDACT_DATA = {
+REDACT_CONFIG = frozenset({CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN})
+REDACT_DATA = frozenset({
     "userID",
     "eMail",
     "firstName",
@@ -21,7 +21,7 @@ REDACT_DATA = {
     "city",
     "zip",
     "email",
-}
+})
 
 
 async def async_get_config_entry_diagnostics(
@@ -9,15 +9,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import UnitOfEnergy, UnitOfMass, UnitOfVolume
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -35,14 +38,14 @@ from .coordinator import MinolDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-_DEVICE_INFO_BASE = {
+_DEVICE_INFO_BASE = MappingProxyType({
     "manufacturer": "Minol-ZENNER",
     "model": "eMonitoring",
     "entry_type": "service",
-}
+})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ServiceMeta:
     service_code: str
     type_text: str
@@ -50,9 +53,11 @@ class _ServiceMeta:
     energy_unit: str
     service_unit: str  # raw meter unit shown in attributes
     device_class: SensorDeviceClass | None
+    price_conf_key: str  # options key holding the price per unit
+    has_co2: bool  # whether the API reports a CO₂ equivalent
 
 
-_SERVICES: list[_ServiceMeta] = [
+_SERVICES: tuple[_ServiceMeta, ...] = (
     _ServiceMeta(
         service_code=SERVICE_HEATING,
         type_text="Heating",
@@ -60,6 +65,8 @@ _SERVICES: list[_ServiceMeta] = [
         energy_unit=UnitOfEnergy.KILO_WATT_HOUR,
         service_unit="EH",
         device_class=SensorDeviceClass.ENERGY,
+        price_conf_key=CONF_HEATING_PRICE,
+        has_co2=True,
     ),
     _ServiceMeta(
         service_code=SERVICE_HOT_WATER,
@@ -68,6 +75,8 @@ _SERVICES: list[_ServiceMeta] = [
         energy_unit=UnitOfEnergy.KILO_WATT_HOUR,
         service_unit="m³",
         device_class=SensorDeviceClass.ENERGY,
+        price_conf_key=CONF_HOT_WATER_PRICE,
+        has_co2=True,
     ),
     _ServiceMeta(
         service_code=SERVICE_COLD_WATER,
@@ -76,14 +85,86 @@ _SERVICES: list[_ServiceMeta] = [
         energy_unit=UnitOfVolume.CUBIC_METERS,
         service_unit="m³",
         device_class=SensorDeviceClass.WATER,
+        price_conf_key=CONF_COLD_WATER_PRICE,
+        has_co2=False,
     ),
-]
+)
 
-_PRICE_CONF_KEY: dict[str, str] = {
-    SERVICE_HEATING: CONF_HEATING_PRICE,
-    SERVICE_HOT_WATER: CONF_HOT_WATER_PRICE,
-    SERVICE_COLD_WATER: CONF_COLD_WATER_PRICE,
-}
+
+@dataclass(frozen=True, kw_only=True)
+class MinolSensorEntityDescription(SensorEntityDescription):
+    """Describes a Minol sensor bound to one service type."""
+
+    service: _ServiceMeta
+    field: str = "energyValue"
+
+
+def _consumption_descriptions(
+    svc: _ServiceMeta,
+) -> tuple[MinolSensorEntityDescription, ...]:
+    """Return the latest-month (and CO₂, if reported) descriptions for a service."""
+    descriptions = [
+        MinolSensorEntityDescription(
+            key=f"{svc.service_code}_latest_month",
+            name=f"{svc.type_text} Latest Month",
+            native_unit_of_measurement=svc.energy_unit,
+            state_class=SensorStateClass.TOTAL,
+            device_class=svc.device_class,
+            icon=svc.icon,
+            suggested_display_precision=2,
+            service=svc,
+        )
+    ]
+    if svc.has_co2:
+        descriptions.append(
+            MinolSensorEntityDescription(
+                key=f"{svc.service_code}_co2_latest_month",
+                name=f"{svc.type_text} CO₂ Latest Month",
+                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+                state_class=SensorStateClass.MEASUREMENT,
+                device_class=SensorDeviceClass.WEIGHT,
+                icon="mdi:molecule-co2",
+                suggested_display_precision=2,
+                service=svc,
+                field="co2kg",
+            )
+        )
+    return tuple(descriptions)
+
+
+def _cost_description(svc: _ServiceMeta) -> MinolSensorEntityDescription:
+    """Return the estimated-cost description for a service."""
+    return MinolSensorEntityDescription(
+        key=f"{svc.service_code}_cost",
+        name=f"{svc.type_text} Cost",
+        native_unit_of_measurement="\u20ac",
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.MONETARY,
+        icon="mdi:currency-eur",
+        suggested_display_precision=2,
+        service=svc,
+    )
+
+
+# Built once at import: (service, consumption descriptions, cost description).
+# Description keys double as the unique_id suffix.
+_SERVICE_DESCRIPTIONS: tuple[
+    tuple[
+        _ServiceMeta,
+        tuple[MinolSensorEntityDescription, ...],
+        MinolSensorEntityDescription,
+    ],
+    ...,
+] = tuple(
+    (svc, _consumption_descriptions(svc), _cost_description(svc))
+    for svc in _SERVICES
+)
+
+_TENANT_DESCRIPTION = SensorEntityDescription(
+    key="tenant_info",
+    name="Tenant Info",
+    icon="mdi:home-account",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -98,61 +179,52 @@ async def async_setup_entry(
 ) -> None:
     """Set up Minol sensors from a config entry."""
     coordinator: MinolDataCoordinator = entry.runtime_data
-
-    entities: list[SensorEntity] = [
-        MinolTenantInfoSensor(coordinator, entry),
+    # One device per entry: every entity shares the same DeviceInfo object
+    device_info = DeviceInfo(
+        **_DEVICE_INFO_BASE,
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Minol Energy",
+    )
+
+    # unique_id = "<entry_id>_<description key>"
+    uid_prefix = f"{entry.entry_id}_"
+
+    active = [
+        (svc, consumption, cost)
+        for svc, consumption, cost in _SERVICE_DESCRIPTIONS
+        if svc.service_code in coordinator.active_services
     ]
 
-    latest = coordinator.data.get("latest_consumption", {})
-    active_services = {
-        c.get("service") for c in latest.get("consumptions", [])
-    }
-
-    for svc in _SERVICES:
-        if svc.service_code not in active_services:
-            continue
-        # Latest month energy / volume
-        entities.append(
+    entities: list[SensorEntity] = [
+        MinolTenantInfoSensor(
+            coordinator,
+            device_info,
+            _TENANT_DESCRIPTION,
+            f"{uid_prefix}{_TENANT_DESCRIPTION.key}",
+        ),
+        *(
             MinolConsumptionSensor(
-                coordinator=coordinator,
-                entry=entry,
-                service=svc,
-                field="energyValue",
-                suffix="latest_month",
-                name=f"{svc.type_text} Latest Month",
-                unit=svc.energy_unit,
-                state_class=SensorStateClass.TOTAL,
-                device_class=svc.device_class,
-                icon=svc.icon,
-            )
-        )
-        # CO2 sensor (cold water has no CO₂ equivalent)
-        if svc.service_code != SERVICE_COLD_WATER:
-            entities.append(
-                MinolConsumptionSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    service=svc,
-                    field="co2kg",
-                    suffix="co2_latest_month",
-                    name=f"{svc.type_text} CO₂ Latest Month",
-                    unit=UnitOfMass.KILOGRAMS,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    device_class=SensorDeviceClass.WEIGHT,
-                    icon="mdi:molecule-co2",
-                )
+                coordinator,
+                device_info,
+                description,
+                f"{uid_prefix}{description.key}",
             )
-        # Cost sensor (only when price configured)
-        price = entry.options.get(_PRICE_CONF_KEY.get(svc.service_code, ""), 0.0)
-        if price:
-            entities.append(
-                MinolCostSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    service=svc,
-                    price=float(price),
-                )
+            for _, consumption, _ in active
+            for description in consumption
+        ),
+        # Cost sensors only for services with a configured price
+        *(
+            MinolCostSensor(
+                coordinator,
+                device_info,
+                cost,
+                f"{uid_prefix}{cost.key}",
+                float(price),
             )
+            for svc, _, cost in active
+            if (price := entry.options.get(svc.price_conf_key, 0.0))
+        ),
+    ]
 
     async_add_entities(entities)
 
@@ -163,14 +235,17 @@ async def async_setup_entry(
 
 
 def _get_consumption_entry(
-    data: dict[str, Any], service_code: str
+    coordinator: MinolDataCoordinator, service_code: str
 ) -> dict[str, Any]:
     """Return the consumption dict for a specific service in the latest period."""
-    latest = data.get("latest_consumption", {})
-    for cons in latest.get("consumptions", []):
-        if cons.get("service") == service_code:
-            return cons
-    return {}
+    return coordinator.consumption_index.get(service_code, {})
+
+
+def _get_consumption_value(
+    coordinator: MinolDataCoordinator, service_code: str, field: str
+) -> float | None:
+    """Return ``field`` of a service's latest consumption as parsed by the coordinator."""
+    return coordinator.consumption_values.get((service_code, field))
 
 
 # ---------------------------------------------------------------------------
@@ -182,52 +257,44 @@ class MinolConsumptionSensor(CoordinatorEntity[MinolDataCoordinator], SensorEnti
     """A sensor showing a single field for one service type in the latest period."""
 
     _attr_has_entity_name = True
-    _attr_suggested_display_precision = 2
+    entity_description: MinolSensorEntityDescription
 
     def __init__(
         self,
         coordinator: MinolDataCoordinator,
-        entry: MinolConfigEntry,
-        service: _ServiceMeta,
-        field: str,
-        suffix: str,
-        name: str,
-        unit: str | None,
-        state_class: SensorStateClass | None,
-        device_class: SensorDeviceClass | None,
-        icon: str,
+        device_info: DeviceInfo,
+        description: MinolSensorEntityDescription,
+        unique_id: str,
     ) -> None:
         super().__init__(coordinator)
-        self._service = service
-        self._field = field
-
-        slug = f"{service.service_code}_{suffix}".lower()
-        self._attr_unique_id = f"{entry.entry_id}_{slug}"
-        self._attr_name = name
-        self._attr_native_unit_of_measurement = unit
-        self._attr_state_class = state_class
-        self._attr_device_class = device_class
-        self._attr_icon = icon
-        self._attr_device_info = {
-            **_DEVICE_INFO_BASE,
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Minol Energy",
-        }
+        self.entity_description = description
+        self._service = description.service
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+        self._resolve()
+
+    def _resolve(self) -> None:
+        """Look up this service's consumption entry and value from the coordinator."""
+        code = self._service.service_code
+        self._cons = _get_consumption_entry(self.coordinator, code)
+        self._current_value = _get_consumption_value(
+            self.coordinator, code, self.entity_description.field
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve the consumption entry and value once per refresh."""
+        self._resolve()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | None:
-        cons = _get_consumption_entry(
-            self.coordinator.data, self._service.service_code
-        )
-        val = cons.get(self._field)
-        return float(val) if val is not None else None
+        return self._current_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        latest = self.coordinator.data.get("latest_consumption", {})
-        cons = _get_consumption_entry(
-            self.coordinator.data, self._service.service_code
-        )
+        latest = self.coordinator.latest_consumption
+        cons = self._cons
         attrs: dict[str, Any] = {
             "period": latest.get("period"),
             "status": latest.get("statusOverall"),
@@ -243,37 +310,47 @@ class MinolTenantInfoSensor(CoordinatorEntity[MinolDataCoordinator], SensorEntit
     """Sensor showing property / tenant info from the user profile."""
 
     _attr_has_entity_name = True
-    _attr_icon = "mdi:home-account"
 
     def __init__(
         self,
         coordinator: MinolDataCoordinator,
-        entry: MinolConfigEntry,
+        device_info: DeviceInfo,
+        description: SensorEntityDescription,
+        unique_id: str,
     ) -> None:
         super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_tenant_info"
-        self._attr_name = "Tenant Info"
-        self._attr_device_info = {
-            **_DEVICE_INFO_BASE,
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Minol Energy",
-        }
-
-    @property
-    def native_value(self) -> str | None:
-        profile = self.coordinator.data.get("profile", {})
+        self.entity_description = description
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+        self._resolve()
+
+    def _resolve(self) -> None:
+        """Cache the profile and the address string derived from it."""
+        profile: dict[str, Any] = self.coordinator.data.get("profile") or {}
         addr = profile.get("billingUnitAddress", {})
         street = addr.get("street", "")
         num = addr.get("houseNumber", "")
         city = addr.get("city", "")
         postal = addr.get("zip", "")
+        self._profile = profile
         if street:
-            return f"{street} {num}, {postal} {city}".strip(", ")
-        return profile.get("billingUnit")
+            self._address = f"{street} {num}, {postal} {city}".strip(", ")
+        else:
+            self._address = profile.get("billingUnit")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up the refreshed profile once per coordinator update."""
+        self._resolve()
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> str | None:
+        return self._address
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        profile = self.coordinator.data.get("profile", {})
+        profile = self._profile
         ref = profile.get("residentialUnitReference", {})
         addr = profile.get("billingUnitAddress", {})
         return {
@@ -295,41 +372,41 @@ class MinolCostSensor(CoordinatorEntity[MinolDataCoordinator], SensorEntity):
     """Estimated cost: latest month consumption × configured price per unit."""
 
     _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.MONETARY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "\u20ac"
-    _attr_icon = "mdi:currency-eur"
-    _attr_suggested_display_precision = 2
+    entity_description: MinolSensorEntityDescription
 
     def __init__(
         self,
         coordinator: MinolDataCoordinator,
-        entry: MinolConfigEntry,
-        service: _ServiceMeta,
+        device_info: DeviceInfo,
+        description: MinolSensorEntityDescription,
+        unique_id: str,
         price: float,
     ) -> None:
         super().__init__(coordinator)
-        self._service = service
+        self.entity_description = description
+        self._service = description.service
         self._price = price
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+        self._current_value = self._compute_cost()
 
-        slug = f"{service.service_code}_cost".lower()
-        self._attr_unique_id = f"{entry.entry_id}_{slug}"
-        self._attr_name = f"{service.type_text} Cost"
-        self._attr_device_info = {
-            **_DEVICE_INFO_BASE,
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Minol Energy",
-        }
-
-    @property
-    def native_value(self) -> float | None:
-        cons = _get_consumption_entry(
-            self.coordinator.data, self._service.service_code
+    def _compute_cost(self) -> float | None:
+        energy = _get_consumption_value(
+            self.coordinator, self._service.service_code, "energyValue"
         )
-        energy = cons.get("energyValue")
         if energy is None:
             return None
-        return round(float(energy) * self._price, 2)
+        return round(energy * self._price, 2)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cost once per refresh."""
+        self._current_value = self._compute_cost()
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | None:
+        return self._current_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
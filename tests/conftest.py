@@ -1,8 +1,10 @@
-"""Stub out homeassistant modules so api.py can be imported without a running HA."""
+"""Stub out homeassistant modules so the integration imports without a running HA."""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import sys
+from typing import Any
 from unittest.mock import MagicMock
 
 # Register stubs for every homeassistant namespace touched by the package
@@ -14,6 +16,7 @@ _HA_MODULES = [
     "homeassistant.core",
     "homeassistant.exceptions",
     "homeassistant.helpers",
+    "homeassistant.helpers.device_registry",
     "homeassistant.helpers.entity_platform",
     "homeassistant.helpers.update_coordinator",
     "homeassistant.components",
@@ -23,3 +26,57 @@ _HA_MODULES = [
 ]
 for _mod in _HA_MODULES:
     sys.modules.setdefault(_mod, MagicMock())
+
+
+# sensor.py subclasses these and decorates with @callback; MagicMock bases
+# would clash, so give the platform plain stand-ins with the fields it uses.
+@dataclass(frozen=True, kw_only=True)
+class _SensorEntityDescription:
+    key: str
+    name: str | None = None
+    icon: str | None = None
+    device_class: Any = None
+    native_unit_of_measurement: str | None = None
+    state_class: Any = None
+    suggested_display_precision: int | None = None
+
+
+class _CoordinatorEntity:
+    def __class_getitem__(cls, _item: Any) -> type:
+        return cls
+
+    def __init__(self, coordinator: Any) -> None:
+        self.coordinator = coordinator
+
+    def _handle_coordinator_update(self) -> None:
+        pass
+
+
+_sensor = sys.modules["homeassistant.components.sensor"]
+_sensor.SensorEntity = type("SensorEntity", (), {})
+_sensor.SensorEntityDescription = _SensorEntityDescription
+
+
+# coordinator.py subclasses DataUpdateCoordinator and raises the HA exceptions
+class _DataUpdateCoordinator:
+    def __class_getitem__(cls, _item: Any) -> type:
+        return cls
+
+    def __init__(
+        self, hass: Any, logger: Any, *, name: str, update_interval: Any
+    ) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data = None
+
+
+_update_coordinator = sys.modules["homeassistant.helpers.update_coordinator"]
+_update_coordinator.CoordinatorEntity = _CoordinatorEntity
+_update_coordinator.DataUpdateCoordinator = _DataUpdateCoordinator
+_update_coordinator.UpdateFailed = type("UpdateFailed", (Exception,), {})
+sys.modules["homeassistant.exceptions"].ConfigEntryAuthFailed = type(
+    "ConfigEntryAuthFailed", (Exception,), {}
+)
+sys.modules["homeassistant.core"].callback = lambda func: func
@@ -5,14 +5,21 @@ All HTTP traffic is mocked — no real network calls are made.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
+from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
 
-from custom_components.minol_energy.api import MinolApiClient, MinolAuthError
+from custom_components.minol_energy.api import (
+    MinolApiClient,
+    MinolAuthError,
+    MinolConnectionError,
+)
 from custom_components.minol_energy.config_flow import (
     _compute_code_challenge,
     _extract_code_from_url,
@@ -20,10 +27,23 @@ from custom_components.minol_energy.config_flow import (
     _get_email_from_token,
 )
 from custom_components.minol_energy.const import (
+    CONF_COLD_WATER_PRICE,
+    CONF_HEATING_PRICE,
+    CONF_HOT_WATER_PRICE,
+    CONF_SCAN_INTERVAL,
     SERVICE_COLD_WATER,
     SERVICE_HEATING,
     SERVICE_HOT_WATER,
 )
+from custom_components.minol_energy.coordinator import (
+    MAX_BACKOFF_INTERVAL,
+    MinolDataCoordinator,
+    _backoff_interval,
+    _parse_values,
+)
+from custom_components.minol_energy.sensor import (
+    async_setup_entry as async_setup_sensors,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -31,16 +51,24 @@ from custom_components.minol_energy.const import (
 # ---------------------------------------------------------------------------
 
 
-def _make_resp(body: str | dict, status: int = 200) -> MagicMock:
+def _make_resp(
+    body: str | dict, status: int = 200, headers: dict[str, str] | None = None
+) -> MagicMock:
     """Async-context-manager mock for an aiohttp response."""
     resp = MagicMock()
     resp.status = status
+    resp.headers = headers or {}
     text_value = json.dumps(body) if isinstance(body, dict) else body
+    resp.content_length = len(text_value.encode())
 
     async def _text():
         return text_value
 
+    async def _read():
+        return text_value.encode()
+
     resp.text = _text
+    resp.read = _read
 
     cm = MagicMock()
 
@@ -102,6 +130,35 @@ class TestGetServiceValue:
         assert isinstance(result, float)
         assert result == 5.0
 
+    def test_falls_through_to_later_duplicate(self):
+        period = self._period([
+            {"service": SERVICE_HEATING},
+            {"service": SERVICE_HEATING, "energyValue": "8"},
+        ])
+        assert MinolApiClient.get_service_value(period, SERVICE_HEATING) == 8.0
+
+
+class TestIndexConsumptions:
+    def test_maps_service_codes(self):
+        heating = {"service": SERVICE_HEATING, "energyValue": 1}
+        cold = {"service": SERVICE_COLD_WATER, "energyValue": 2}
+        index = MinolApiClient.index_consumptions({"consumptions": [heating, cold]})
+        assert index == {SERVICE_HEATING: heating, SERVICE_COLD_WATER: cold}
+
+    def test_first_entry_wins(self):
+        first = {"service": SERVICE_HEATING, "energyValue": 1}
+        second = {"service": SERVICE_HEATING, "energyValue": 2}
+        index = MinolApiClient.index_consumptions({"consumptions": [first, second]})
+        assert index[SERVICE_HEATING] is first
+
+    def test_empty_period(self):
+        assert MinolApiClient.index_consumptions({}) == {}
+
+    def test_service_codes_are_interned(self):
+        code = "".join(["1", "00"])  # built at runtime, not a literal
+        index = MinolApiClient.index_consumptions({"consumptions": [{"service": code}]})
+        assert next(iter(index)) is SERVICE_HEATING
+
 
 # ---------------------------------------------------------------------------
 # Token expiry helpers
@@ -131,6 +188,45 @@ class TestTokenExpiry:
         assert client._is_token_expired() is True
 
 
+# ---------------------------------------------------------------------------
+# Session management
+# ---------------------------------------------------------------------------
+
+
+class TestSession:
+    async def test_session_is_reused(self):
+        client = MinolApiClient(access_token="tok")
+        try:
+            assert client._ensure_session() is client._ensure_session()
+        finally:
+            await client.close()
+
+    async def test_connector_keeps_connections_alive(self):
+        client = MinolApiClient(access_token="tok")
+        try:
+            connector = client._ensure_session().connector
+            assert connector.limit_per_host == 4
+        finally:
+            await client.close()
+
+    async def test_cookies_are_not_stored(self):
+        client = MinolApiClient(access_token="tok")
+        try:
+            session = client._ensure_session()
+            assert isinstance(session.cookie_jar, aiohttp.DummyCookieJar)
+        finally:
+            await client.close()
+
+    async def test_new_session_after_close(self):
+        client = MinolApiClient(access_token="tok")
+        first = client._ensure_session()
+        await client.close()
+        try:
+            assert client._ensure_session() is not first
+        finally:
+            await client.close()
+
+
 # ---------------------------------------------------------------------------
 # Token refresh
 # ---------------------------------------------------------------------------
@@ -177,6 +273,61 @@ class TestRefreshAccessToken:
         assert result is False
         assert client._access_token == "old"
 
+    async def test_concurrent_refreshes_post_once(self):
+        client = MinolApiClient(access_token="old", refresh_token="rt")
+        token_response = {"access_token": "new_access", "expires_in": 3600}
+
+        def _slow_post(*args, **kwargs):
+            cm = _make_resp(token_response)
+            enter = cm.__aenter__
+
+            async def _aenter(_self):
+                await asyncio.sleep(0)
+                return await enter()
+
+            cm.__aenter__ = _aenter
+            return cm
+
+        session = MagicMock()
+        session.post = MagicMock(side_effect=_slow_post)
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            results = await asyncio.gather(
+                client._refresh_access_token(),
+                client._refresh_access_token(),
+                client._refresh_access_token(),
+            )
+
+        assert results == [True, True, True]
+        assert session.post.call_count == 1
+        assert client._access_token == "new_access"
+
+    async def test_refresh_already_finished_is_reused(self):
+        # A request sent with "old" gets its 401 only after another coroutine
+        # has completed the refresh to "new_access"
+        client = MinolApiClient(access_token="old", refresh_token="rt")
+        sent_auth: list[str] = []
+
+        def _request(method, url, **kwargs):
+            sent_auth.append(kwargs["headers"]["Authorization"])
+            if len(sent_auth) == 1:
+                client._access_token = "new_access"
+                return _make_resp("", status=401)
+            return _make_resp({"ok": 1})
+
+        session = MagicMock()
+        session.request = MagicMock(side_effect=_request)
+
+        with (
+            patch.object(client, "_ensure_session", return_value=session),
+            patch.object(client, "_do_refresh_access_token") as do_refresh,
+        ):
+            result = await client._get("/profiles")
+
+        assert result == {"ok": 1}
+        do_refresh.assert_not_called()
+        assert sent_auth == ["Bearer old", "Bearer new_access"]
+
     async def test_missing_access_token_in_response_returns_false(self):
         client = MinolApiClient(access_token="old", refresh_token="rt")
         session = MagicMock()
@@ -188,6 +339,423 @@ class TestRefreshAccessToken:
         assert result is False
 
 
+# ---------------------------------------------------------------------------
+# _request
+# ---------------------------------------------------------------------------
+
+
+class TestRequest:
+    async def test_parses_json_body(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(return_value=_make_resp({"data": [1, 2]}))
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            result = await client._get("/profiles")
+
+        assert result == {"data": [1, 2]}
+
+    async def test_empty_body_returns_none(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(return_value=_make_resp("  "))
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            assert await client._get("/profiles") is None
+
+    async def test_invalid_json_returns_none(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(return_value=_make_resp("<html>oops</html>"))
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            assert await client._get("/profiles") is None
+
+    async def test_network_error_retries_without_token_refresh(self):
+        client = MinolApiClient(access_token="tok", refresh_token="rt")
+        session = MagicMock()
+        session.request = MagicMock(
+            side_effect=[aiohttp.ClientConnectionError("reset"), _make_resp({"ok": 1})]
+        )
+
+        with (
+            patch.object(client, "_ensure_session", return_value=session),
+            patch.object(client, "_refresh_access_token") as refresh,
+            patch("custom_components.minol_energy.api.asyncio.sleep") as sleep,
+        ):
+            result = await client._get("/profiles")
+
+        assert result == {"ok": 1}
+        refresh.assert_not_called()
+        sleep.assert_awaited_once()
+
+    async def test_repeated_network_error_raises(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(side_effect=aiohttp.ClientConnectionError("down"))
+
+        with (
+            patch.object(client, "_ensure_session", return_value=session),
+            patch("custom_components.minol_energy.api.asyncio.sleep"),
+        ):
+            with pytest.raises(MinolConnectionError):
+                await client._get("/profiles")
+
+    async def test_timeout_retried_then_raises_connection_error(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(side_effect=TimeoutError())
+
+        with (
+            patch.object(client, "_ensure_session", return_value=session),
+            patch("custom_components.minol_energy.api.asyncio.sleep") as sleep,
+        ):
+            with pytest.raises(MinolConnectionError):
+                await client._get("/profiles")
+
+        assert session.request.call_count == 2
+        sleep.assert_awaited_once()
+
+    async def test_payload_sent_as_encoded_json(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(return_value=_make_resp({}))
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            await client._request("POST", "/x", payload={"a": 1})
+
+        kwargs = session.request.call_args.kwargs
+        assert json.loads(kwargs["data"]) == {"a": 1}
+        assert "json" not in kwargs
+
+    def test_api_headers_include_credentials_and_token(self):
+        client = MinolApiClient(access_token="tok")
+        headers = client._api_headers()
+        assert headers["Authorization"] == "Bearer tok"
+        assert headers["client_id"]
+        assert headers["correlationId"] != client._api_headers()["correlationId"]
+
+    async def test_not_modified_reuses_cached_body(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(
+            side_effect=[
+                _make_resp({"data": [1]}, headers={"ETag": '"v1"'}),
+                _make_resp("", status=304),
+            ]
+        )
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            first = await client._get("/profiles")
+            second = await client._get("/profiles")
+
+        assert second == first == {"data": [1]}
+        headers = session.request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+
+    async def test_no_validators_skips_cache(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(return_value=_make_resp({"data": []}))
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            await client._get("/profiles")
+
+        assert client._cache == {}
+
+    async def test_new_query_replaces_cache_entry(self):
+        client = MinolApiClient(access_token="tok")
+        session = MagicMock()
+        session.request = MagicMock(
+            side_effect=[
+                _make_resp({"period": "1"}, headers={"ETag": '"d1"'}),
+                _make_resp({"period": "2"}, headers={"ETag": '"d2"'}),
+            ]
+        )
+
+        with patch.object(client, "_ensure_session", return_value=session):
+            await client._get(
+                "/consumptions", startdate="2024-01-01", enddate="2024-05-01"
+            )
+            second = await client._get(
+                "/consumptions", startdate="2024-01-01", enddate="2024-05-02"
+            )
+
+        assert second == {"period": "2"}
+        # The day-old validator is not sent for the new query …
+        headers = session.request.call_args.kwargs["headers"]
+        assert "If-None-Match" not in headers
+        # … and its entry is replaced rather than kept alongside
+        assert len(client._cache) == 1
+        (entry,) = client._cache.values()
+        assert entry[1] == '"d2"'
+        assert entry[3] == {"period": "2"}
+
+
+# ---------------------------------------------------------------------------
+# get_all_data
+# ---------------------------------------------------------------------------
+
+_PROFILE = {
+    "userID": "000000000535",
+    "billingUnit": "0607986",
+    "residentialUnitReference": {"residentialUnitID": "000002"},
+}
+
+
+class TestGetAllData:
+    def _patch_endpoints(self, client: MinolApiClient, consumptions: list[dict]):
+        async def _profiles():
+            return [_PROFILE]
+
+        async def _masterdata(bu, ru):
+            return {"billingPeriods": []}
+
+        async def _periods(bu, ru):
+            return [{"period": "2024-05"}]
+
+        async def _consumptions(bu, ru, startdate, enddate):
+            return consumptions
+
+        return [
+            patch.object(client, "get_profiles", side_effect=_profiles),
+            patch.object(client, "get_masterdata", side_effect=_masterdata),
+            patch.object(client, "get_available_periods", side_effect=_periods),
+            patch.object(client, "get_consumptions", side_effect=_consumptions),
+        ]
+
+    async def test_collects_all_endpoints(self):
+        client = MinolApiClient(access_token="tok")
+        period = {
+            "period": "2024-05",
+            "statusOverall": "UVI_AVAILABLE",
+            "consumptions": [{"service": SERVICE_HEATING, "energyValue": 1.0}],
+        }
+        patches = self._patch_endpoints(client, [period])
+        for p in patches:
+            p.start()
+        try:
+            data = await client.get_all_data()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert data["billing_unit_id"] == "0607986"
+        assert data["residential_unit_id"] == "000002"
+        assert data["masterdata"] == {"billingPeriods": []}
+        assert data["available_periods"] == [{"period": "2024-05"}]
+        assert data["latest_consumption"] == period
+
+    async def test_profile_reused_across_refreshes(self):
+        client = MinolApiClient(access_token="tok")
+        patches = self._patch_endpoints(client, [])
+        mocks = [p.start() for p in patches]
+        try:
+            await client.get_all_data()
+            await client.get_all_data()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert mocks[0].call_count == 1
+        assert mocks[3].call_count == 2
+
+    async def test_profile_refetched_after_ttl(self):
+        client = MinolApiClient(access_token="tok")
+        patches = self._patch_endpoints(client, [])
+        mocks = [p.start() for p in patches]
+        try:
+            await client.get_all_data()
+            client._profile_cache_ts -= 2 * 24 * 3600
+            await client.get_all_data()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert mocks[0].call_count == 2
+
+    async def test_residence_paths_built_from_profile(self):
+        client = MinolApiClient(access_token="tok")
+        with (
+            patch.object(client, "get_profiles", return_value=[_PROFILE]),
+            patch.object(client, "_get", return_value=None) as get,
+        ):
+            await client.get_all_data()
+
+        paths = {c.args[0] for c in get.call_args_list}
+        assert paths == {
+            "/billingUnit/0607986/residentialUnit/000002/masterdata",
+            "/billingUnit/0607986/residentialUnit/000002/consumptions/availableData",
+            "/billingUnit/0607986/residentialUnit/000002/consumptions",
+        }
+
+    async def test_missing_profile_raises_auth_error(self):
+        client = MinolApiClient(access_token="tok")
+
+        async def _profiles():
+            return []
+
+        with patch.object(client, "get_profiles", side_effect=_profiles):
+            with pytest.raises(MinolAuthError):
+                await client.get_all_data()
+
+    async def test_failed_request_cancels_siblings(self):
+        client = MinolApiClient(access_token="tok")
+        cancelled: list[str] = []
+
+        async def _masterdata(bu, ru):
+            await asyncio.sleep(0)  # let the sibling requests start first
+            raise MinolAuthError("refresh failed")
+
+        async def _pending(name):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        async def _periods(bu, ru):
+            return await _pending("periods")
+
+        async def _consumptions(bu, ru, startdate, enddate):
+            return await _pending("consumptions")
+
+        with (
+            patch.object(client, "get_profiles", return_value=[_PROFILE]),
+            patch.object(client, "get_masterdata", side_effect=_masterdata),
+            patch.object(client, "get_available_periods", side_effect=_periods),
+            patch.object(client, "get_consumptions", side_effect=_consumptions),
+        ):
+            with pytest.raises(MinolAuthError) as exc_info:
+                await asyncio.wait_for(client.get_all_data(), timeout=1)
+
+        assert sorted(cancelled) == ["consumptions", "periods"]
+        assert exc_info.value.__suppress_context__
+
+
+# ---------------------------------------------------------------------------
+# Coordinator polling backoff
+# ---------------------------------------------------------------------------
+
+
+class TestBackoffInterval:
+    def test_changed_data_uses_base_interval(self):
+        base = timedelta(minutes=60)
+        assert _backoff_interval(base, 0) == base
+
+    def test_doubles_per_stable_cycle(self):
+        base = timedelta(minutes=60)
+        assert _backoff_interval(base, 1) == timedelta(hours=2)
+        assert _backoff_interval(base, 2) == timedelta(hours=4)
+
+    def test_capped_at_maximum(self):
+        base = timedelta(minutes=60)
+        assert _backoff_interval(base, 50) == MAX_BACKOFF_INTERVAL
+
+    def test_never_below_configured_interval(self):
+        base = timedelta(hours=24)
+        assert _backoff_interval(base, 3) == base
+
+
+class TestAdaptUpdateInterval:
+    def _coordinator(self, client: MagicMock | None = None) -> MinolDataCoordinator:
+        entry = MagicMock()
+        entry.options = {CONF_SCAN_INTERVAL: 60}
+        return MinolDataCoordinator(MagicMock(), client or MagicMock(), entry)
+
+    def test_grows_while_stable_and_resets_on_change(self):
+        coordinator = self._coordinator()
+        base = timedelta(minutes=60)
+
+        coordinator._adapt_update_interval({"period": "2024-05"})
+        assert coordinator.update_interval == base
+        coordinator._adapt_update_interval({"period": "2024-05"})
+        assert coordinator.update_interval == 2 * base
+        coordinator._adapt_update_interval({"period": "2024-05"})
+        assert coordinator.update_interval == 4 * base
+
+        coordinator._adapt_update_interval({"period": "2024-06"})
+        assert coordinator.update_interval == base
+        assert coordinator._stable_cycles == 0
+
+    async def test_failed_refresh_drops_backoff(self):
+        client = MagicMock()
+        client.get_all_data = AsyncMock(side_effect=MinolConnectionError("down"))
+        coordinator = self._coordinator(client)
+        coordinator._stable_cycles = 3
+        coordinator.update_interval = MAX_BACKOFF_INTERVAL
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(minutes=60)
+        assert coordinator._stable_cycles == 0
+
+
+class TestParseValues:
+    def test_parses_sensor_fields(self):
+        index = {SERVICE_HEATING: {"energyValue": "12.5", "co2kg": 3, "estimated": True}}
+        assert _parse_values(index) == {
+            (SERVICE_HEATING, "energyValue"): 12.5,
+            (SERVICE_HEATING, "co2kg"): 3.0,
+        }
+
+    def test_skips_missing_and_non_numeric(self):
+        index = {SERVICE_COLD_WATER: {"energyValue": "n/a"}}
+        assert _parse_values(index) == {}
+
+
+# ---------------------------------------------------------------------------
+# Sensor platform
+# ---------------------------------------------------------------------------
+
+
+class TestSensorSetup:
+    async def _setup(self, services: set[str], options: dict) -> list:
+        coordinator = MagicMock()
+        coordinator.active_services = frozenset(services)
+        coordinator.consumption_index = {}
+        coordinator.consumption_values = {}
+        coordinator.latest_consumption = {}
+        coordinator.data = {"profile": {}}
+        entry = MagicMock()
+        entry.entry_id = "entry1"
+        entry.options = options
+        entry.runtime_data = coordinator
+        added: list = []
+        await async_setup_sensors(MagicMock(), entry, added.extend)
+        return added
+
+    async def test_unique_ids_and_names_are_stable(self):
+        # Existing entity registry entries depend on these exact IDs
+        entities = await self._setup(
+            {SERVICE_HEATING, SERVICE_HOT_WATER, SERVICE_COLD_WATER},
+            {
+                CONF_HEATING_PRICE: 0.1,
+                CONF_HOT_WATER_PRICE: 0.2,
+                CONF_COLD_WATER_PRICE: 3.0,
+            },
+        )
+        assert {e._attr_unique_id: e.entity_description.name for e in entities} == {
+            "entry1_tenant_info": "Tenant Info",
+            "entry1_100_latest_month": "Heating Latest Month",
+            "entry1_100_co2_latest_month": "Heating CO₂ Latest Month",
+            "entry1_100_cost": "Heating Cost",
+            "entry1_200_latest_month": "Hot Water Latest Month",
+            "entry1_200_co2_latest_month": "Hot Water CO₂ Latest Month",
+            "entry1_200_cost": "Hot Water Cost",
+            "entry1_300_latest_month": "Cold Water Latest Month",
+            "entry1_300_cost": "Cold Water Cost",
+        }
+
+    async def test_only_active_and_priced_services(self):
+        entities = await self._setup({SERVICE_COLD_WATER}, {CONF_HEATING_PRICE: 0.1})
+        assert [e._attr_unique_id for e in entities] == [
+            "entry1_tenant_info",
+            "entry1_300_latest_month",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # Config flow helpers (pure functions — no mocking needed)
 # ---------------------------------------------------------------------------